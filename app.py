@@ -1,26 +1,93 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for
-import yaml
+from flask import (
+    Flask,
+    Response,
+    render_template,
+    request,
+    jsonify,
+    redirect,
+    stream_with_context,
+    url_for,
+)
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+import orjson
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional
 from src.models.database import DatabaseManager
 from main import CrawlerManager
 import os
 
+class OrjsonProvider(JSONProvider):
+    """基于orjson的JSON序列化（C实现，jsonify/get_json直接受益）"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 app.config["JSON_AS_ASCII"] = False
+app.json = OrjsonProvider(app)
+
+# 页面级缓存：数据只在爬取后变化，命中时连模板渲染都省掉
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 60})
+
 
-# 加载配置
-with open("config.yaml", "r", encoding="utf-8") as f:
-    config = yaml.safe_load(f)
+@lru_cache(maxsize=None)
+def get_manager(config_path: str = "config.yaml") -> CrawlerManager:
+    """CrawlerManager单例（调试热重载/测试共用一个实例）"""
+    return CrawlerManager(config_path)
 
-db = DatabaseManager(config["database"]["path"])
-crawler_manager = CrawlerManager("config.yaml")
+
+crawler_manager = get_manager()
+config = crawler_manager.config
+# 与爬虫共用同一个DatabaseManager，写入后的缓存失效对Web立即可见
+db = crawler_manager.db
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@app.teardown_appcontext
+def rollback_connection(exception=None):
+    """请求结束时回滚未完成的事务（连接保留给线程复用）"""
+    db.rollback_if_open()
+
+
+# 按过滤条件组合缓存SQL文本：同一字符串可命中SQLite连接内的语句缓存
+_INDEX_QUERY_CACHE = {}
+
+
+def _index_query(has_conference: bool, has_year: bool, has_search: bool) -> str:
+    """构建（并缓存）首页列表查询，LIMIT/OFFSET均为占位符"""
+    key = (has_conference, has_year, has_search)
+    sql = _INDEX_QUERY_CACHE.get(key)
+    if sql is None:
+        sql = "SELECT *, COUNT(*) OVER () AS total FROM papers WHERE 1=1"
+        if has_conference:
+            sql += " AND conference = ?"
+        if has_year:
+            sql += " AND year = ?"
+        if has_search:
+            sql += (
+                " AND id IN (SELECT rowid FROM papers_fts WHERE papers_fts MATCH ?)"
+            )
+        sql += " ORDER BY year DESC, created_at DESC LIMIT ? OFFSET ?"
+        _INDEX_QUERY_CACHE[key] = sql
+    return sql
+
+
+def _fts_query(search: str) -> str:
+    """把用户输入转换为FTS5查询（逐词加引号，避免语法字符报错）"""
+    tokens = [t.replace('"', "") for t in search.split()]
+    return " ".join(f'"{t}"' for t in tokens if t)
+
+
 @app.route("/")
+@cache.cached(timeout=60, query_string=True)
 def index():
     """首页 - 论文列表"""
     # 获取查询参数
@@ -30,58 +97,46 @@ def index():
     search = request.args.get("search", "")
     per_page = config["web"]["per_page"]
 
-    # 构建查询条件
-    query = "SELECT * FROM papers WHERE 1=1"
+    # 构建查询条件（窗口函数同查询内取总数，避免再跑一遍COUNT）
     params = []
 
     if conference:
-        query += " AND conference = ?"
         params.append(conference)
 
     if year:
-        query += " AND year = ?"
         params.append(int(year))
 
-    if search:
-        query += " AND (title LIKE ? OR authors LIKE ?)"
-        search_term = f"%{search}%"
-        params.append(search_term)
-        params.append(search_term)
+    # 纯引号/空白的输入会得到空FTS串，MATCH ''是语法错误，按无搜索处理
+    fts = _fts_query(search) if search else ""
+    if fts:
+        params.append(fts)
 
-    query += " ORDER BY year DESC, created_at DESC"
-
-    # 获取总数
-    count_query = query.replace("SELECT *", "SELECT COUNT(*)")
-    import sqlite3
-
-    conn = sqlite3.connect(config["database"]["path"])
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute(count_query, params)
-    total = cursor.fetchone()[0]
+    query = _index_query(bool(conference), bool(year), bool(fts))
 
     # 分页
     offset = (page - 1) * per_page
-    query += f" LIMIT {per_page} OFFSET {offset}"
+    params.extend([per_page, offset])
 
+    cursor = db._get_conn().cursor()
     cursor.execute(query, params)
     papers = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+
+    # 总数来自窗口列；翻页越界时结果为空，回退为0
+    total = papers[0]["total"] if papers else 0
+    for paper in papers:
+        paper.pop("total", None)
 
     # 计算总页数
     total_pages = (total + per_page - 1) // per_page
 
-    # 获取统计信息
-    stats = db.get_statistics()
+    # 获取统计信息（缓存，爬虫写入时失效）
+    stats = db.cached_statistics()
 
     # 获取所有会议列表
     conferences = sorted(list(stats["by_conference"].keys()))
 
     # 获取所有年份
-    cursor = sqlite3.connect(config["database"]["path"]).cursor()
-    cursor.execute("SELECT DISTINCT year FROM papers ORDER BY year DESC")
-    years = [row[0] for row in cursor.fetchall()]
-    cursor.connection.close()
+    years = db.get_years()
 
     return render_template(
         "index.html",
@@ -101,14 +156,9 @@ def index():
 @app.route("/paper/<int:paper_id>")
 def paper_detail(paper_id):
     """论文详情页"""
-    import sqlite3
-
-    conn = sqlite3.connect(config["database"]["path"])
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    cursor = db._get_conn().cursor()
     cursor.execute("SELECT * FROM papers WHERE id = ?", (paper_id,))
     paper = cursor.fetchone()
-    conn.close()
 
     if paper:
         paper = dict(paper)
@@ -118,16 +168,13 @@ def paper_detail(paper_id):
 
 
 @app.route("/statistics")
+@cache.cached(timeout=300)
 def statistics():
     """统计信息页"""
-    stats = db.get_statistics()
+    stats = db.cached_statistics()
 
     # 获取爬取历史
-    import sqlite3
-
-    conn = sqlite3.connect(config["database"]["path"])
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    cursor = db._get_conn().cursor()
     cursor.execute(
         """
         SELECT conference, year, papers_count, status, created_at
@@ -137,7 +184,6 @@ def statistics():
     """
     )
     history = [dict(row) for row in cursor.fetchall()]
-    conn.close()
 
     return render_template("statistics.html", stats=stats, history=history)
 
@@ -153,6 +199,7 @@ def crawl():
         if conference and year:
             try:
                 crawler_manager.crawl_conference(conference, year)
+                cache.clear()
                 return jsonify(
                     {"success": True, "message": f"成功爬取 {conference} {year}"}
                 )
@@ -172,6 +219,7 @@ def crawl_all():
     """爬取所有启用的会议"""
     try:
         crawler_manager.crawl_all()
+        cache.clear()
         return jsonify({"success": True, "message": "批量爬取完成"})
     except Exception as e:
         logger.error(f"批量爬取失败: {e}")
@@ -184,21 +232,32 @@ def show_config():
     return render_template("config.html", config=config)
 
 
+def _json_stream(rows):
+    """把行迭代器编码为JSON数组流（逐行产出，内存占用恒定）"""
+    yield b"["
+    for i, row in enumerate(rows):
+        prefix = b"," if i else b""
+        yield prefix + orjson.dumps(dict(row), option=orjson.OPT_NON_STR_KEYS)
+    yield b"]"
+
+
 @app.route("/api/papers")
 def api_papers():
-    """API: 获取论文列表"""
+    """API: 获取论文列表（流式输出，不整体物化）"""
     conference = request.args.get("conference")
     year = request.args.get("year", type=int)
     limit = request.args.get("limit", 20, type=int)
 
-    papers = db.get_papers(conference=conference, year=year, limit=limit)
-    return jsonify(papers)
+    rows = db.iter_papers(conference=conference, year=year, limit=limit)
+    return Response(
+        stream_with_context(_json_stream(rows)), mimetype="application/json"
+    )
 
 
 @app.route("/api/stats")
 def api_stats():
     """API: 获取统计信息"""
-    stats = db.get_statistics()
+    stats = db.cached_statistics()
     return jsonify(stats)
 
 
@@ -222,7 +281,27 @@ def main():
     """
     )
 
-    app.run(host=host, port=port, debug=debug)
+    if debug:
+        # 调试模式用Werkzeug开发服务器（单线程，带重载）
+        app.run(host=host, port=port, debug=True)
+    else:
+        # 生产模式交给gunicorn多worker（见run.sh）
+        os.execvp(
+            "gunicorn",
+            [
+                "gunicorn",
+                "app:app",
+                "--workers",
+                str(os.cpu_count() or 2),
+                "--threads",
+                "4",
+                "--worker-class",
+                "gthread",
+                "--preload",
+                "--bind",
+                f"{host}:{port}",
+            ],
+        )
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
+import os
 import yaml
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, List
 from src.crawlers.base import DBLPCrawler
 from src.crawlers.conference_crawlers import (
@@ -18,6 +21,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _read_config(config_path: str, mtime: float) -> Dict:
+    """读取并解析配置文件（按路径+修改时间缓存，文件变更自动失效）"""
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
 class CrawlerManager:
     """爬虫管理器"""
 
@@ -43,11 +53,16 @@ class CrawlerManager:
             ],
         }
 
+        # 解析在子进程中执行（懒启动），抓取线程只做网络I/O不抢GIL
+        self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        for crawlers in self.crawlers.values():
+            for crawler in crawlers:
+                crawler.parse_executor = self._parse_pool
+
     def load_config(self, config_path: str) -> Dict:
         """加载配置文件"""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return _read_config(config_path, os.path.getmtime(config_path))
         except FileNotFoundError:
             logger.error(f"配置文件未找到: {config_path}")
             raise
@@ -81,32 +96,31 @@ class CrawlerManager:
             self.db.log_crawl_history(conference_name, year, 0, "empty")
 
     def _deduplicate_papers(self, papers: List[Dict]) -> List[Dict]:
-        """去重论文列表"""
-        seen = set()
-        unique = []
-
-        for paper in papers:
-            key = (paper["title"], paper["conference"], paper["year"])
-            if key not in seen:
-                seen.add(key)
-                unique.append(paper)
-
-        return unique
+        """去重论文列表（单次dict构建，键同数据库的UNIQUE约束）"""
+        return list(
+            {(p["title"], p["conference"], p["year"]): p for p in papers}.values()
+        )
 
     def crawl_all(self):
-        """爬取所有配置的会议"""
+        """爬取所有配置的会议（按会议/年份并发，站点内串行限速）"""
         conferences = self.config.get("conferences", [])
 
-        for conf in conferences:
-            if not conf.get("enabled", True):
-                continue
-
-            name = conf["name"]
-            years = conf.get("years", [])
-
-            for year in years:
+        jobs = [
+            (conf["name"], year)
+            for conf in conferences
+            if conf.get("enabled", True)
+            for year in conf.get("years", [])
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(self.crawl_conference, name, year): (name, year)
+                for name, year in jobs
+            }
+            for future in as_completed(futures):
+                name, year = futures[future]
                 try:
-                    self.crawl_conference(name, year)
+                    future.result()
                 except Exception as e:
                     logger.error(f"爬取失败 {name} {year}: {e}")
 
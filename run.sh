@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+# 生产部署：多worker gunicorn（SQLite WAL模式下各worker可并发读）
+# 监听地址/端口与config.yaml的web配置保持一致
+set -e
+
+exec gunicorn 'app:app' \
+    --workers "$(nproc)" \
+    --threads 4 \
+    --worker-class gthread \
+    --preload \
+    --bind 127.0.0.1:5000
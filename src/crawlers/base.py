@@ -1,7 +1,18 @@
 from abc import ABC, abstractmethod
+from datetime import timedelta
+from io import BytesIO
 from typing import List, Dict, Optional
+from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+import html.entities
+import os
+import re
+import threading
 import time
 import logging
 
@@ -10,6 +21,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 每个目标站点一个信号量：同站点请求串行（含抓取间隔），不同站点可并发
+_host_locks: Dict[str, threading.Semaphore] = {}
+_host_locks_guard = threading.Lock()
+
+
+def _host_lock(host: str) -> threading.Semaphore:
+    """获取（并按需创建）指定站点的信号量"""
+    with _host_locks_guard:
+        lock = _host_locks.get(host)
+        if lock is None:
+            lock = threading.Semaphore(1)
+            _host_locks[host] = lock
+        return lock
+
 
 class BaseCrawler(ABC):
     """爬虫基类"""
@@ -20,37 +45,136 @@ class BaseCrawler(ABC):
         self.timeout = self.config.get("request_timeout", 30)
         self.retry_times = self.config.get("retry_times", 3)
         self.delay = self.config.get("delay_between_requests", 1)
+        # CrawlerManager注入的进程池：解析移出抓取线程，不占GIL
+        self.parse_executor = None
 
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
 
+        # 磁盘HTTP缓存：未变化的页面直接命中本地，重复爬取不再走网络
+        os.makedirs("cache", exist_ok=True)
+        self.session = requests_cache.CachedSession(
+            "cache/http_cache.sqlite",
+            expire_after=timedelta(days=7),
+            cache_control=True,
+        )
+        self.session.headers.update(self.headers)
+        # 连接复用 + urllib3重试（指数退避）
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=self.retry_times,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     @abstractmethod
     def crawl(self, year: int) -> List[Dict]:
         """爬取指定年份的论文"""
         pass
 
     def fetch_page(self, url: str) -> str:
-        """获取网页内容，带重试机制"""
-        for attempt in range(self.retry_times):
+        """获取网页内容，带重试机制（同站点请求串行化）"""
+        with _host_lock(urlparse(url).netloc):
             try:
-                logger.info(f"正在访问: {url} (尝试 {attempt + 1}/{self.retry_times})")
-                response = requests.get(url, headers=self.headers, timeout=self.timeout)
+                logger.info(f"正在访问: {url}")
+                response = self.session.get(url, timeout=self.timeout)
                 response.raise_for_status()
-                time.sleep(self.delay)
+                # 命中本地缓存时无需抓取间隔
+                if not getattr(response, "from_cache", False):
+                    time.sleep(self.delay)
                 return response.text
             except requests.RequestException as e:
-                logger.warning(f"请求失败: {e}")
-                if attempt < self.retry_times - 1:
-                    time.sleep(2**attempt)  # 指数退避
-                else:
-                    logger.error(f"多次尝试后仍失败: {url}")
-                    raise
-        return ""
-
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """解析HTML"""
-        return BeautifulSoup(html, "lxml")
+                logger.error(f"多次尝试后仍失败: {url} ({e})")
+                raise
+
+    def parse_html(self, html: str) -> lxml.html.HtmlElement:
+        """解析HTML（lxml原生树，配合预编译XPath在C层取值）"""
+        return lxml.html.fromstring(html)
+
+    def _run_parse(self, parse_func, *args) -> List[Dict]:
+        """执行模块级解析函数；注入了进程池则在子进程中解析"""
+        if self.parse_executor is not None:
+            return self.parse_executor.submit(parse_func, *args).result()
+        return parse_func(*args)
+
+
+# dblp.dtd用ISO实体集编码重音字符（&uuml;等）；XML自身的5个实体保持原样
+_XML_BUILTIN_ENTITIES = {"amp", "lt", "gt", "quot", "apos"}
+_ENTITY_RE = re.compile(r"&([A-Za-z][A-Za-z0-9]*);")
+
+
+def _resolve_dblp_entities(xml: str) -> str:
+    """把DTD定义的命名实体改写为数字字符引用（解析时不取远端DTD）"""
+
+    def repl(match: re.Match) -> str:
+        name = match.group(1)
+        if name in _XML_BUILTIN_ENTITIES:
+            return match.group(0)
+        codepoint = html.entities.name2codepoint.get(name)
+        return f"&#{codepoint};" if codepoint is not None else match.group(0)
+
+    return _ENTITY_RE.sub(repl, xml)
+
+
+def _parse_dblp_xml(xml: str, year: int, conference_name: str) -> List[Dict]:
+    """流式解析DBLP的XML导出（模块级函数，可在子进程中执行）"""
+    papers = []
+
+    for _, record in etree.iterparse(
+        BytesIO(_resolve_dblp_entities(xml).encode("utf-8")),
+        events=("end",),
+        tag="inproceedings",
+        load_dtd=False,
+        resolve_entities=False,
+        recover=True,
+    ):
+        paper = _parse_dblp_record(record, year, conference_name)
+        if paper:
+            papers.append(paper)
+        # 及时释放已处理的节点，保持解析内存恒定
+        record.clear()
+        while record.getprevious() is not None:
+            del record.getparent()[0]
+
+    return papers
+
+
+def _parse_dblp_record(record, year: int, conference_name: str) -> Optional[Dict]:
+    """解析单条<inproceedings>记录"""
+    title_tag = record.find("title")
+    # 标题可能含<i>等内联标签，拼接全部文本
+    title = "".join(title_tag.itertext()).strip() if title_tag is not None else ""
+
+    if not title:
+        return None
+
+    # 作者
+    authors = [
+        "".join(author.itertext()).strip() for author in record.findall("author")
+    ]
+
+    # 电子版链接：首个为论文页，.pdf结尾的为PDF，doi.org的为DOI
+    ee_links = [ee.text.strip() for ee in record.findall("ee") if ee.text]
+    pdf_url = next((link for link in ee_links if link.endswith(".pdf")), None)
+    paper_url = ee_links[0] if ee_links else None
+    doi = next((link for link in ee_links if "doi.org" in link), None)
+
+    return {
+        "title": title,
+        "authors": ", ".join(authors),
+        "conference": conference_name,
+        "year": year,
+        "abstract": None,  # DBLP不提供摘要
+        "pdf_url": pdf_url,
+        "paper_url": paper_url,
+        "doi": doi,
+    }
 
 
 class DBLPCrawler(BaseCrawler):
@@ -70,33 +194,15 @@ class DBLPCrawler(BaseCrawler):
         )
 
     def crawl(self, year: int) -> List[Dict]:
-        """从DBLP爬取论文"""
+        """从DBLP的XML导出爬取论文（流式解析，内存占用与会议规模无关）"""
         papers = []
 
-        # 根据会议构建DBLP URL
-        if self.conference_name == "NDSS":
-            url = f"https://dblp.org/db/conf/ndss/ndss{year}.html"
-        elif self.conference_name == "USENIX Security":
-            url = f"https://dblp.org/db/conf/uss/uss{year}.html"
-        elif self.conference_name == "CCS":
-            url = f"https://dblp.org/db/conf/ccs/ccs{year}.html"
-        elif self.conference_name == "S&P":
-            url = f"https://dblp.org/db/conf/sp/sp{year}.html"
-        else:
-            logger.error(f"不支持的会议: {self.conference_name}")
-            return papers
+        # 结构化XML比HTML页面更小更稳定
+        url = f"https://dblp.org/db/conf/{self.dblp_key}/{self.dblp_key}{year}.xml"
 
         try:
-            html = self.fetch_page(url)
-            soup = self.parse_html(html)
-
-            # 查找所有论文条目
-            entries = soup.find_all("li", class_="entry")
-
-            for entry in entries:
-                paper = self._parse_entry(entry, year)
-                if paper:
-                    papers.append(paper)
+            xml = self.fetch_page(url)
+            papers = self._run_parse(_parse_dblp_xml, xml, year, self.conference_name)
 
             logger.info(
                 f"从DBLP爬取到 {len(papers)} 篇论文 ({self.conference_name} {year})"
@@ -106,56 +212,3 @@ class DBLPCrawler(BaseCrawler):
             logger.error(f"DBLP爬取失败: {e}")
 
         return papers
-
-    def _parse_entry(self, entry, year: int) -> Optional[Dict]:
-        """解析单个论文条目"""
-        try:
-            # 标题
-            title_tag = entry.find("span", class_="title")
-            title = title_tag.get_text(strip=True) if title_tag else None
-
-            if not title:
-                return None
-
-            # 作者
-            authors = []
-            author_tags = entry.find_all("span", itemprop="author")
-            for author_tag in author_tags:
-                author_name = author_tag.find("span", itemprop="name")
-                if author_name:
-                    authors.append(author_name.get_text(strip=True))
-
-            # PDF链接
-            pdf_url = None
-            ee_tags = entry.find_all("a", class_="ee")
-            for ee_tag in ee_tags:
-                href = ee_tag.get("href", "")
-                if ".pdf" in href:
-                    pdf_url = href
-                    break
-
-            # 论文页面链接
-            paper_url = None
-            if ee_tags:
-                paper_url = ee_tags[0].get("href")
-
-            # DOI
-            doi = None
-            doi_tag = entry.find("a", href=lambda x: x and "doi.org" in x)
-            if doi_tag:
-                doi = doi_tag.get("href")
-
-            return {
-                "title": title,
-                "authors": ", ".join(authors),
-                "conference": self.conference_name,
-                "year": year,
-                "abstract": None,  # DBLP不提供摘要
-                "pdf_url": pdf_url,
-                "paper_url": paper_url,
-                "doi": doi,
-            }
-
-        except Exception as e:
-            logger.warning(f"解析论文条目失败: {e}")
-            return None
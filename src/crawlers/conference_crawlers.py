@@ -1,11 +1,125 @@
 from typing import List, Dict, Optional
 from .base import BaseCrawler
-import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 预编译XPath（模块加载时编译一次；模块级以便解析函数可被子进程pickle调用）
+_NDSS_X_PAPER = etree.XPath("//div[contains(@class, 'paper')]")
+_NDSS_X_TITLE = etree.XPath("string(.//h4)")
+_NDSS_X_AUTHORS = etree.XPath("string(.//p[contains(@class, 'authors')])")
+# 精确匹配.pdf结尾（XPath 1.0没有ends-with，用substring等价实现）
+_NDSS_X_PDF = etree.XPath(
+    ".//a[substring(@href, string-length(@href) - 3) = '.pdf']/@href"
+)
+
+_USENIX_X_ITEM = etree.XPath("//div[contains(@class, 'views-row')]")
+# 优先h4，没有才退回h3（与文档顺序无关）
+_USENIX_X_TITLE_H4 = etree.XPath("string(.//h4)")
+_USENIX_X_TITLE_H3 = etree.XPath("string(.//h3)")
+_USENIX_X_AUTHORS = etree.XPath(
+    "string(.//div[contains(@class, 'field-name-field-person-public-name')])"
+)
+_USENIX_X_ABSTRACT = etree.XPath("string(.//div[contains(@class, 'field-name-body')])")
+_USENIX_X_PRESENTATION = etree.XPath(".//a[contains(@href, 'presentation')]/@href")
+
+_SP_X_PAPER = etree.XPath("//div[contains(@class, 'paper')]")
+_SP_X_TITLE = etree.XPath("string(.//span[contains(@class, 'title')])")
+_SP_X_AUTHORS = etree.XPath("string(.//span[contains(@class, 'authors')])")
+_SP_X_PDF = etree.XPath(
+    ".//a[substring(@href, string-length(@href) - 3) = '.pdf']/@href"
+)
+
+
+def _parse_ndss_page(html: str, year: int) -> List[Dict]:
+    """解析NDSS官网接收论文页（模块级函数，可在子进程中执行）"""
+    papers = []
+    tree = lxml.html.fromstring(html)
+
+    for item in _NDSS_X_PAPER(tree):
+        title = _NDSS_X_TITLE(item).strip()
+        if not title:
+            continue
+
+        # 查找PDF链接
+        pdf_links = _NDSS_X_PDF(item)
+
+        papers.append(
+            {
+                "title": title,
+                "authors": _NDSS_X_AUTHORS(item).strip() or None,
+                "conference": "NDSS",
+                "year": year,
+                "abstract": None,
+                "pdf_url": pdf_links[0] if pdf_links else None,
+                "paper_url": None,
+                "doi": None,
+            }
+        )
+
+    return papers
+
+
+def _parse_usenix_page(html: str, year: int) -> List[Dict]:
+    """解析USENIX技术议程页（模块级函数，可在子进程中执行）"""
+    papers = []
+    tree = lxml.html.fromstring(html)
+
+    for item in _USENIX_X_ITEM(tree):
+        title = _USENIX_X_TITLE_H4(item).strip() or _USENIX_X_TITLE_H3(item).strip()
+        if not title:
+            continue
+
+        # 报告页面链接
+        links = _USENIX_X_PRESENTATION(item)
+        paper_url = "https://www.usenix.org" + links[0] if links else None
+
+        papers.append(
+            {
+                "title": title,
+                "authors": _USENIX_X_AUTHORS(item).strip() or None,
+                "conference": "USENIX Security",
+                "year": year,
+                "abstract": _USENIX_X_ABSTRACT(item).strip() or None,
+                "pdf_url": None,
+                "paper_url": paper_url,
+                "doi": None,
+            }
+        )
+
+    return papers
+
+
+def _parse_sp_page(html: str, year: int) -> List[Dict]:
+    """解析S&P官网论文列表页（模块级函数，可在子进程中执行）"""
+    papers = []
+    tree = lxml.html.fromstring(html)
+
+    for item in _SP_X_PAPER(tree):
+        title = _SP_X_TITLE(item).strip()
+        if not title:
+            continue
+
+        # PDF链接
+        pdf_links = _SP_X_PDF(item)
+
+        papers.append(
+            {
+                "title": title,
+                "authors": _SP_X_AUTHORS(item).strip() or None,
+                "conference": "S&P",
+                "year": year,
+                "abstract": None,
+                "pdf_url": pdf_links[0] if pdf_links else None,
+                "paper_url": None,
+                "doi": None,
+            }
+        )
+
+    return papers
+
 
 class NDSSCrawler(BaseCrawler):
     """NDSS会议专用爬虫"""
@@ -19,16 +133,10 @@ class NDSSCrawler(BaseCrawler):
 
         try:
             html = self.fetch_page(url)
-            soup = self.parse_html(html)
 
             # 根据NDSS网站结构解析
             # 注意：实际结构可能需要根据网站调整
-            paper_items = soup.find_all("div", class_="paper")
-
-            for item in paper_items:
-                paper = self._parse_paper(item, year)
-                if paper:
-                    papers.append(paper)
+            papers = self._run_parse(_parse_ndss_page, html, year)
 
             logger.info(f"从NDSS官网爬取到 {len(papers)} 篇论文 ({year})")
 
@@ -37,37 +145,6 @@ class NDSSCrawler(BaseCrawler):
 
         return papers
 
-    def _parse_paper(self, item, year: int) -> Optional[Dict]:
-        """解析论文条目"""
-        try:
-            title = item.find("h4")
-            if title:
-                title = title.get_text(strip=True)
-
-            authors = item.find("p", class_="authors")
-            if authors:
-                authors = authors.get_text(strip=True)
-
-            # 查找PDF链接
-            pdf_link = item.find("a", href=lambda x: x and ".pdf" in x)
-            pdf_url = pdf_link.get("href") if pdf_link else None
-
-            if title:
-                return {
-                    "title": title,
-                    "authors": authors,
-                    "conference": "NDSS",
-                    "year": year,
-                    "abstract": None,
-                    "pdf_url": pdf_url,
-                    "paper_url": None,
-                    "doi": None,
-                }
-        except Exception as e:
-            logger.warning(f"解析NDSS论文失败: {e}")
-
-        return None
-
 
 class USENIXSecurityCrawler(BaseCrawler):
     """USENIX Security会议专用爬虫"""
@@ -81,15 +158,7 @@ class USENIXSecurityCrawler(BaseCrawler):
 
         try:
             html = self.fetch_page(url)
-            soup = self.parse_html(html)
-
-            # 查找所有论文条目
-            paper_items = soup.find_all("div", class_="views-row")
-
-            for item in paper_items:
-                paper = self._parse_paper(item, year)
-                if paper:
-                    papers.append(paper)
+            papers = self._run_parse(_parse_usenix_page, html, year)
 
             logger.info(f"从USENIX官网爬取到 {len(papers)} 篇论文 ({year})")
 
@@ -98,45 +167,6 @@ class USENIXSecurityCrawler(BaseCrawler):
 
         return papers
 
-    def _parse_paper(self, item, year: int) -> Optional[Dict]:
-        """解析论文条目"""
-        try:
-            # 标题
-            title_tag = item.find("h4") or item.find("h3")
-            title = title_tag.get_text(strip=True) if title_tag else None
-
-            # 作者
-            authors_tag = item.find("div", class_="field-name-field-person-public-name")
-            authors = authors_tag.get_text(strip=True) if authors_tag else None
-
-            # 摘要
-            abstract_tag = item.find("div", class_="field-name-body")
-            abstract = abstract_tag.get_text(strip=True) if abstract_tag else None
-
-            # PDF链接
-            pdf_link = item.find(
-                "a", href=lambda x: x and "presentation" in str(x).lower()
-            )
-            paper_url = None
-            if pdf_link and pdf_link.get("href"):
-                paper_url = "https://www.usenix.org" + pdf_link.get("href")
-
-            if title:
-                return {
-                    "title": title,
-                    "authors": authors,
-                    "conference": "USENIX Security",
-                    "year": year,
-                    "abstract": abstract,
-                    "pdf_url": None,
-                    "paper_url": paper_url,
-                    "doi": None,
-                }
-        except Exception as e:
-            logger.warning(f"解析USENIX论文失败: {e}")
-
-        return None
-
 
 class CCSCrawler(BaseCrawler):
     """ACM CCS会议专用爬虫"""
@@ -164,15 +194,7 @@ class SPCrawler(BaseCrawler):
 
         try:
             html = self.fetch_page(url)
-            soup = self.parse_html(html)
-
-            # 查找论文列表
-            paper_items = soup.find_all("div", class_="paper")
-
-            for item in paper_items:
-                paper = self._parse_paper(item, year)
-                if paper:
-                    papers.append(paper)
+            papers = self._run_parse(_parse_sp_page, html, year)
 
             logger.info(f"从S&P官网爬取到 {len(papers)} 篇论文 ({year})")
 
@@ -180,34 +202,3 @@ class SPCrawler(BaseCrawler):
             logger.error(f"S&P爬取失败: {e}")
 
         return papers
-
-    def _parse_paper(self, item, year: int) -> Optional[Dict]:
-        """解析论文条目"""
-        try:
-            # 标题
-            title_tag = item.find("span", class_="title")
-            title = title_tag.get_text(strip=True) if title_tag else None
-
-            # 作者
-            authors_tag = item.find("span", class_="authors")
-            authors = authors_tag.get_text(strip=True) if authors_tag else None
-
-            # PDF链接
-            pdf_link = item.find("a", href=lambda x: x and ".pdf" in x)
-            pdf_url = pdf_link.get("href") if pdf_link else None
-
-            if title:
-                return {
-                    "title": title,
-                    "authors": authors,
-                    "conference": "S&P",
-                    "year": year,
-                    "abstract": None,
-                    "pdf_url": pdf_url,
-                    "paper_url": None,
-                    "doi": None,
-                }
-        except Exception as e:
-            logger.warning(f"解析S&P论文失败: {e}")
-
-        return None
@@ -1,21 +1,72 @@
 import sqlite3
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Any, Callable, Iterator, List, Optional, Dict
 import os
 
 
 class DatabaseManager:
     """数据库管理类"""
 
+    # 连接级PRAGMA：WAL读写分离、降低fsync频率、64MB页缓存、内存临时表、256MB mmap
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+    )
+
     def __init__(self, db_path: str = "./data/papers.db"):
         self.db_path = db_path
         # 确保数据目录存在
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # 每个线程复用一条读连接，避免每次请求都重新打开数据库文件
+        self._tls = threading.local()
+        # 写操作共享一条连接，用锁串行化
+        self._write_lock = threading.Lock()
+        self._write_conn: Optional[sqlite3.Connection] = None
+        # 统计类查询缓存：写入时失效，兜底TTL防止外部进程写库后长期陈旧
+        self._cache_lock = threading.Lock()
+        self._cache: Dict[str, tuple] = {}
         self.init_database()
 
+    def _new_conn(self) -> sqlite3.Connection:
+        """创建新连接"""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in self._PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """获取当前线程的读连接（懒创建，跨请求复用）"""
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = self._new_conn()
+            self._tls.conn = conn
+        return conn
+
+    def rollback_if_open(self):
+        """回滚当前线程已有的读连接；线程尚未建连则不做任何事"""
+        conn = getattr(self._tls, "conn", None)
+        if conn is not None:
+            conn.rollback()
+
+    def _get_write_conn(self) -> sqlite3.Connection:
+        """获取共享写连接（调用方需持有 self._write_lock）"""
+        if self._write_conn is None:
+            self._write_conn = self._new_conn()
+        return self._write_conn
+
     def init_database(self):
         """初始化数据库表结构"""
         conn = sqlite3.connect(self.db_path)
+        for pragma in self._PRAGMAS:
+            conn.execute(pragma)
         cursor = conn.cursor()
 
         # 创建论文表
@@ -58,70 +109,174 @@ class DatabaseManager:
         # 创建索引
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_conference_year 
+            CREATE INDEX IF NOT EXISTS idx_conference_year
             ON papers(conference, year)
         """
         )
 
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_created_at 
+            CREATE INDEX IF NOT EXISTS idx_created_at
             ON papers(created_at)
         """
         )
 
+        # 覆盖首页 ORDER BY year DESC, created_at DESC 的排序，避免filesort
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_year_created
+            ON papers(year DESC, created_at DESC, id)
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_conf_year_created
+            ON papers(conference, year DESC, created_at DESC)
+        """
+        )
+
+        # 创建全文检索表（标题/作者），替代 LIKE '%...%' 全表扫描
+        cursor.execute(
+            """
+            SELECT COUNT(*) FROM sqlite_master
+            WHERE type = 'table' AND name = 'papers_fts'
+        """
+        )
+        fts_exists = cursor.fetchone()[0] > 0
+
+        cursor.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+                title, authors,
+                content='papers', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """
+        )
+
+        # 触发器保持 papers_fts 与 papers 同步
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS papers_fts_ai AFTER INSERT ON papers BEGIN
+                INSERT INTO papers_fts(rowid, title, authors)
+                VALUES (new.id, new.title, new.authors);
+            END
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS papers_fts_ad AFTER DELETE ON papers BEGIN
+                INSERT INTO papers_fts(papers_fts, rowid, title, authors)
+                VALUES ('delete', old.id, old.title, old.authors);
+            END
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS papers_fts_au AFTER UPDATE ON papers BEGIN
+                INSERT INTO papers_fts(papers_fts, rowid, title, authors)
+                VALUES ('delete', old.id, old.title, old.authors);
+                INSERT INTO papers_fts(rowid, title, authors)
+                VALUES (new.id, new.title, new.authors);
+            END
+        """
+        )
+
+        # 首次创建时回填已有论文
+        if not fts_exists:
+            cursor.execute("INSERT INTO papers_fts(papers_fts) VALUES ('rebuild')")
+
         conn.commit()
         conn.close()
 
+    # 统计缓存的兜底过期时间（秒）
+    _CACHE_TTL = 60
+
+    def _cached(self, key: str, loader: Callable[[], Any]) -> Any:
+        """按key缓存loader的结果，写入时统一失效"""
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[1] < self._CACHE_TTL:
+                return hit[0]
+
+        value = loader()
+
+        with self._cache_lock:
+            self._cache[key] = (value, time.monotonic())
+        return value
+
+    def invalidate_cache(self):
+        """清空统计缓存（数据写入后调用）"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    # 插入/更新论文的UPSERT语句（单条与批量共用）
+    _UPSERT_PAPER_SQL = """
+        INSERT INTO papers (
+            title, authors, conference, year, abstract,
+            pdf_url, paper_url, doi, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(title, conference, year)
+        DO UPDATE SET
+            authors = excluded.authors,
+            abstract = excluded.abstract,
+            pdf_url = excluded.pdf_url,
+            paper_url = excluded.paper_url,
+            doi = excluded.doi,
+            updated_at = excluded.updated_at
+    """
+
+    @staticmethod
+    def _paper_row(paper_data: Dict) -> tuple:
+        """把论文字典转换为UPSERT参数元组"""
+        return (
+            paper_data.get("title"),
+            paper_data.get("authors"),
+            paper_data.get("conference"),
+            paper_data.get("year"),
+            paper_data.get("abstract"),
+            paper_data.get("pdf_url"),
+            paper_data.get("paper_url"),
+            paper_data.get("doi"),
+            datetime.now(),
+        )
+
     def insert_paper(self, paper_data: Dict) -> bool:
         """插入或更新论文数据"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self._get_write_conn()
 
-        try:
-            cursor.execute(
-                """
-                INSERT INTO papers (
-                    title, authors, conference, year, abstract, 
-                    pdf_url, paper_url, doi, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(title, conference, year) 
-                DO UPDATE SET
-                    authors = excluded.authors,
-                    abstract = excluded.abstract,
-                    pdf_url = excluded.pdf_url,
-                    paper_url = excluded.paper_url,
-                    doi = excluded.doi,
-                    updated_at = excluded.updated_at
-            """,
-                (
-                    paper_data.get("title"),
-                    paper_data.get("authors"),
-                    paper_data.get("conference"),
-                    paper_data.get("year"),
-                    paper_data.get("abstract"),
-                    paper_data.get("pdf_url"),
-                    paper_data.get("paper_url"),
-                    paper_data.get("doi"),
-                    datetime.now(),
-                ),
-            )
-
-            conn.commit()
-            return True
-        except Exception as e:
-            print(f"插入论文失败: {e}")
-            return False
-        finally:
-            conn.close()
+            try:
+                conn.execute(self._UPSERT_PAPER_SQL, self._paper_row(paper_data))
+                self.invalidate_cache()
+                return True
+            except Exception as e:
+                print(f"插入论文失败: {e}")
+                return False
 
     def insert_papers_batch(self, papers: List[Dict]) -> int:
-        """批量插入论文"""
-        success_count = 0
-        for paper in papers:
-            if self.insert_paper(paper):
-                success_count += 1
-        return success_count
+        """批量插入论文（单事务，一次fsync）"""
+        if not papers:
+            return 0
+
+        with self._write_lock:
+            conn = self._get_write_conn()
+
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.executemany(
+                    self._UPSERT_PAPER_SQL, [self._paper_row(p) for p in papers]
+                )
+                conn.execute("COMMIT")
+                self.invalidate_cache()
+                return cursor.rowcount
+            except Exception as e:
+                # BEGIN本身失败（如别的进程持有写锁）时没有事务可回滚
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                print(f"批量插入论文失败: {e}")
+                return 0
 
     def get_papers(
         self,
@@ -130,9 +285,7 @@ class DatabaseManager:
         limit: Optional[int] = None,
     ) -> List[Dict]:
         """查询论文"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._get_conn().cursor()
 
         query = "SELECT * FROM papers WHERE 1=1"
         params = []
@@ -152,25 +305,51 @@ class DatabaseManager:
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(row) for row in rows]
 
+    def iter_papers(
+        self,
+        conference: Optional[str] = None,
+        year: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[sqlite3.Row]:
+        """逐行迭代论文（不做fetchall物化，适合流式响应）"""
+        cursor = self._get_conn().cursor()
+
+        query = "SELECT * FROM papers WHERE 1=1"
+        params = []
+
+        if conference:
+            query += " AND conference = ?"
+            params.append(conference)
+
+        if year:
+            query += " AND year = ?"
+            params.append(year)
+
+        query += " ORDER BY created_at DESC"
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor.execute(query, params)
+        yield from cursor
+
     def paper_exists(self, title: str, conference: str, year: int) -> bool:
         """检查论文是否已存在"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._get_conn().cursor()
 
         cursor.execute(
             """
-            SELECT COUNT(*) FROM papers 
+            SELECT COUNT(*) FROM papers
             WHERE title = ? AND conference = ? AND year = ?
         """,
             (title, conference, year),
         )
 
         count = cursor.fetchone()[0]
-        conn.close()
 
         return count > 0
 
@@ -183,24 +362,38 @@ class DatabaseManager:
         error_message: Optional[str] = None,
     ):
         """记录爬取历史"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._write_lock:
+            conn = self._get_write_conn()
+            cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO crawl_history (conference, year, papers_count, status, error_message)
-            VALUES (?, ?, ?, ?, ?)
-        """,
-            (conference, year, papers_count, status, error_message),
-        )
+            cursor.execute(
+                """
+                INSERT INTO crawl_history (conference, year, papers_count, status, error_message)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (conference, year, papers_count, status, error_message),
+            )
 
-        conn.commit()
-        conn.close()
+        self.invalidate_cache()
+
+    def get_years(self) -> List[int]:
+        """获取所有年份（带缓存）"""
+
+        def load():
+            cursor = self._get_conn().cursor()
+            # GROUP BY 走 idx_year_created 跳跃扫描，DISTINCT 则退化为全表扫描
+            cursor.execute("SELECT year FROM papers GROUP BY year ORDER BY year DESC")
+            return [row[0] for row in cursor.fetchall()]
+
+        return self._cached("years", load)
+
+    def cached_statistics(self) -> Dict:
+        """获取统计信息（带缓存，写入时失效）"""
+        return self._cached("statistics", self.get_statistics)
 
     def get_statistics(self) -> Dict:
         """获取统计信息"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._get_conn().cursor()
 
         # 总论文数
         cursor.execute("SELECT COUNT(*) FROM papers")
@@ -209,8 +402,8 @@ class DatabaseManager:
         # 各会议论文数
         cursor.execute(
             """
-            SELECT conference, COUNT(*) as count 
-            FROM papers 
+            SELECT conference, COUNT(*) as count
+            FROM papers
             GROUP BY conference
         """
         )
@@ -220,8 +413,6 @@ class DatabaseManager:
         cursor.execute("SELECT MAX(created_at) FROM papers")
         last_update = cursor.fetchone()[0]
 
-        conn.close()
-
         return {
             "total_papers": total_papers,
             "by_conference": by_conference,